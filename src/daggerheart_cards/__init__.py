@@ -6,26 +6,15 @@ and generate printable 3x3 card sheet PDFs.
 
 Modules:
     - zip_reader: ZIP file reading and PDF discovery
-    - image_extractor: Image extraction from PDFs (pypdf + PyMuPDF fallback)
+    - image_extractor: Image extraction from PDFs (PyMuPDF + pypdf fallback)
     - pdf_generator: PDF generation for card sheets
     - layout: High-level API orchestrating the above modules
-"""
 
-from .layout import (
-    # Data classes
-    CardImage,
-    FailedPdf,
-    # Path helpers
-    find_assets_dir,
-    find_temp_dir,
-    find_images_dir,
-    # Core functions
-    collect_card_images,
-    build_cards_pdf,
-    write_3x3_image_pdf,
-    # State
-    failed_pdfs,
-)
+The layout re-exports below are resolved lazily (PEP 562) so that
+importing the package does not pull in rich, PyMuPDF, pypdf and
+reportlab unless they are actually needed.
+"""
+from importlib import import_module
 
 __all__ = [
     "CardImage",
@@ -39,3 +28,8 @@ __all__ = [
     "failed_pdfs",
 ]
 
+
+def __getattr__(name: str):
+    if name in __all__:
+        return getattr(import_module(".layout", __name__), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -4,23 +4,11 @@ from __future__ import annotations
 import argparse
 from pathlib import Path
 
-from rich.console import Console
-from rich.progress import Progress, SpinnerColumn, TextColumn, BarColumn, TaskProgressColumn, TimeElapsedColumn
-from rich.panel import Panel
-from rich.table import Table
-from rich import box
-
-from daggerheart_cards.layout import (
-    build_cards_pdf, 
-    collect_card_images,
-    print_failed_pdfs_report,
-)
+# Heavy imports (rich, and the layout module pulling in fitz/pypdf) are
+# deferred into the command functions so that e.g. --help stays fast.
 from daggerheart_cards.zip_reader import find_assets_dir, find_images_dir
 
 
-console = Console()
-
-
 def build_parser() -> argparse.ArgumentParser:
     parser = argparse.ArgumentParser(
         description="Daggerheart Cards – Generate printable card PDF with 3x3 layout"
@@ -40,9 +28,20 @@ def build_parser() -> argparse.ArgumentParser:
         help="Path to assets directory (default: <project_root>/src/assets).",
     )
     extract_parser.add_argument(
-        "--no-fallback",
+        "--prefer-pypdf",
         action="store_true",
-        help="Disable PyMuPDF fallback (use only pypdf, useful for testing).",
+        help="Try pypdf before PyMuPDF (useful for testing).",
+    )
+    extract_parser.add_argument(
+        "--workers",
+        type=int,
+        default=None,
+        help="Number of extraction worker processes (default: auto, 1 disables the pool).",
+    )
+    extract_parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Disable the content-addressed extraction cache.",
     )
     
     # Build command - extract images and generate PDF
@@ -63,16 +62,42 @@ def build_parser() -> argparse.ArgumentParser:
         help="Path to output file (default: build/daggerheart-cards.pdf).",
     )
     build_cmd.add_argument(
-        "--no-fallback",
+        "--prefer-pypdf",
+        action="store_true",
+        help="Try pypdf before PyMuPDF (useful for testing).",
+    )
+    build_cmd.add_argument(
+        "--workers",
+        type=int,
+        default=None,
+        help="Number of extraction worker processes (default: auto, 1 disables the pool).",
+    )
+    build_cmd.add_argument(
+        "--no-cache",
         action="store_true",
-        help="Disable PyMuPDF fallback (use only pypdf, useful for testing).",
+        help="Disable the content-addressed extraction cache.",
     )
 
     return parser
 
 
-def run_extract(assets_dir: Path, use_fitz_fallback: bool) -> None:
+def run_extract(
+    assets_dir: Path,
+    prefer_pypdf: bool,
+    num_workers: int | None = None,
+    use_cache: bool = True,
+) -> None:
     """Run the extract command - extract images only."""
+    from rich.console import Console
+    from rich.progress import Progress, SpinnerColumn, TextColumn, BarColumn, TaskProgressColumn, TimeElapsedColumn
+    from rich.panel import Panel
+    from rich.table import Table
+    from rich import box
+
+    from daggerheart_cards.layout import collect_card_images, print_failed_pdfs_report
+
+    console = Console()
+
     console.print()
     console.print(Panel.fit(
         "[bold cyan]🖼️  Daggerheart Cards - Extract Images[/bold cyan]\n"
@@ -89,10 +114,12 @@ def run_extract(assets_dir: Path, use_fitz_fallback: bool) -> None:
         TimeElapsedColumn(),
         console=console,
     ) as progress:
-        cards = collect_card_images(
+        cards, failures = collect_card_images(
             assets_dir=assets_dir, 
             progress=progress,
-            use_fitz_fallback=use_fitz_fallback,
+            prefer_pypdf=prefer_pypdf,
+            num_workers=num_workers,
+            use_cache=use_cache,
         )
     
     # Print summary
@@ -106,7 +133,7 @@ def run_extract(assets_dir: Path, use_fitz_fallback: bool) -> None:
     table.add_row("📁 Output folder", f"[bold]{find_images_dir()}[/bold]")
     
     console.print(table)
-    print_failed_pdfs_report()
+    print_failed_pdfs_report(failures)
     
     console.print()
     console.print("[green]✔[/green] [bold green]Done![/bold green] Images extracted successfully.")
@@ -132,14 +159,20 @@ def main(argv: list[str] | None = None) -> None:
     if args.command == "extract":
         run_extract(
             assets_dir=assets_dir,
-            use_fitz_fallback=not args.no_fallback,
+            prefer_pypdf=args.prefer_pypdf,
+            num_workers=args.workers,
+            use_cache=not args.no_cache,
         )
     elif args.command == "build":
+        from daggerheart_cards.layout import build_cards_pdf
+
         output_path = Path(args.output).resolve()
         build_cards_pdf(
             output_path=output_path, 
             assets_dir=assets_dir,
-            use_fitz_fallback=not args.no_fallback,
+            prefer_pypdf=args.prefer_pypdf,
+            num_workers=args.workers,
+            use_cache=not args.no_cache,
         )
 
 
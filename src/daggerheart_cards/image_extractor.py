@@ -1,17 +1,75 @@
 """Image extraction from PDF files."""
 from __future__ import annotations
 
+import hashlib
+import os
+import shutil
+from functools import lru_cache
 from dataclasses import dataclass
 from io import BytesIO
 from pathlib import Path
 from typing import List, Optional
 
-import fitz  # PyMuPDF - robust PDF reader
-from pypdf import PdfReader
-from pypdf.errors import PdfStreamError
+from PIL import Image
 
+from .zip_reader import find_temp_dir
 
-@dataclass
+
+# Render resolution for rasterized pages: a 2x matrix doubles the
+# resolution relative to the PDF's native page size.
+_RENDER_SCALE = 2.0
+
+# Rasterized pages never need more pixels than a 3x3 card slot
+# (190x266 pt) printed at 300 DPI - anything above this is invisible at
+# print size and only inflates the scratch PNG and the output PDF.
+_MAX_RENDER_PX = (792, 1108)
+
+# PyMuPDF loads a ~30 MB shared library, so it is imported lazily on
+# first use and cached here (together with the default render matrix).
+_fitz = None
+_render_matrix = None
+
+
+def _get_fitz():
+    """Import PyMuPDF (fitz) on first use and cache the module."""
+    global _fitz, _render_matrix
+    if _fitz is None:
+        import fitz  # PyMuPDF - robust PDF reader
+        _fitz = fitz
+        _render_matrix = fitz.Matrix(_RENDER_SCALE, _RENDER_SCALE)
+    return _fitz
+
+
+# Exception types the extractors are known to raise on bad input; anything
+# outside this tuple is a genuine bug and should surface. Resolved lazily
+# because PdfReadError lives in the lazily-imported pypdf package.
+_extraction_errors: tuple | None = None
+
+
+def _extraction_error_types() -> tuple:
+    global _extraction_errors
+    if _extraction_errors is None:
+        from pypdf.errors import PdfReadError
+        # RuntimeError covers fitz's FileDataError hierarchy
+        _extraction_errors = (
+            PdfReadError, ValueError, KeyError, AssertionError, RuntimeError, OSError,
+        )
+    return _extraction_errors
+
+
+def _looks_like_scan(data: bytes | memoryview) -> bool:
+    """
+    Heuristic for scanned/pre-rendered image PDFs (the common Daggerheart
+    card format): DCT-encoded images, no fonts, and a non-trivial size.
+    These are pypdf's worst case, so they go straight to fitz.
+    """
+    if len(data) <= 256 * 1024:
+        return False
+    buf = data if isinstance(data, (bytes, bytearray)) else bytes(data)
+    return buf.find(b"/DCTDecode") >= 0 and buf.find(b"/Font") < 0
+
+
+@dataclass(slots=True, frozen=True)
 class CardImage:
     """Represents an extracted card image."""
 
@@ -20,7 +78,7 @@ class CardImage:
     image_path: Path
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class FailedPdf:
     """Represents a PDF that failed to be processed."""
 
@@ -30,37 +88,153 @@ class FailedPdf:
     used_fallback: bool = False
 
 
+@lru_cache(maxsize=None)
+def _find_cache_dir() -> Path:
+    """Find (or create) the content-addressed extraction cache folder.
+
+    Memoized - called once per extracted PDF otherwise.
+    """
+    cache_dir = find_temp_dir() / "cache"
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    return cache_dir
+
+
+def _pdf_digest(data: bytes | memoryview) -> str:
+    """Content hash of raw PDF bytes, used as the cache key prefix."""
+    return hashlib.blake2b(data, digest_size=16).hexdigest()
+
+
+def _cache_lookup(cache_dir: Path, digest: str, page_index: int) -> Path | None:
+    """Return the cached image for (digest, page), or None on a miss."""
+    return next(cache_dir.glob(f"{digest}_p{page_index}.*"), None)
+
+
+def _manifest_path(cache_dir: Path, digest: str) -> Path:
+    """Path of the manifest recording a fully cached PDF's page files."""
+    return cache_dir / f"{digest}.manifest"
+
+
+def _cache_restore_all(cache_dir: Path, digest: str, output_dir: Path,
+                       zip_name: str, pdf_stem: str) -> Optional[List[Path]]:
+    """
+    Restore every page of a fully cached PDF without opening it.
+
+    The manifest lists one "p<index><suffix>" tail per page. Returns the
+    restored output paths, or None if the manifest or any page file is
+    missing (the caller then runs a normal extraction).
+    """
+    manifest = _manifest_path(cache_dir, digest)
+    if not manifest.exists():
+        return None
+    tails = manifest.read_text().split()
+    cached = [cache_dir / f"{digest}_{tail}" for tail in tails]
+    if not all(c.exists() for c in cached):
+        return None
+    paths: List[Path] = []
+    for tail, src in zip(tails, cached):
+        out_path = output_dir / f"{zip_name}_{pdf_stem}_{tail}"
+        _copy_or_link(src, out_path)
+        paths.append(out_path)
+    return paths
+
+
+def _cache_write_manifest(cache_dir: Path, digest: str, paths: List[Path]) -> None:
+    """Record the page-file tails of a successful extraction."""
+    tails = ["p" + p.name.rsplit("_p", 1)[1] for p in paths]
+    _manifest_path(cache_dir, digest).write_text("\n".join(tails))
+
+
+def _copy_or_link(src: Path, dst: Path) -> None:
+    """Hardlink src to dst, falling back to a plain copy across filesystems."""
+    if dst.exists():
+        dst.unlink()
+    try:
+        os.link(src, dst)
+    except OSError:
+        shutil.copy(src, dst)
+
+
+def _unlink_existing(path: str | Path) -> None:
+    """
+    Remove a stale output file so the next write creates a fresh inode.
+
+    Extracted images are hardlinked into the cache, so writing through an
+    existing path would rewrite the cache entry of whatever digest
+    produced the stale file - a changed PDF with an unchanged name would
+    silently poison the old digest's cached pages. Every writer of the
+    images dir must go through this (or _copy_or_link) first.
+    """
+    try:
+        os.unlink(path)
+    except FileNotFoundError:
+        pass
+
+
 def extract_images_pypdf(
-    data: bytes,
+    data: bytes | memoryview,
     output_dir: Path,
     zip_name: str,
     pdf_stem: str,
+    use_cache: bool = True,
 ) -> List[Path]:
     """
     Extract images from a PDF using pypdf.
     
     Extracts the largest embedded image from each page.
-    
+
     Args:
-        data: Raw PDF bytes
+        data: Raw PDF bytes (any buffer-protocol object; BytesIO copies
+            the buffer once at this boundary)
         output_dir: Directory to save extracted images
         zip_name: Name of the source ZIP (for filename)
         pdf_stem: PDF filename without extension (for filename)
-        
+        use_cache: If True, reuse cached results for identical PDF bytes
+
     Returns:
         List of paths to extracted image files
-        
+
     Raises:
         PdfStreamError: If pypdf cannot read the PDF
         ValueError: If PDF header is invalid
     """
-    if not data.startswith(b'%PDF'):
-        raise ValueError(f"Invalid PDF header: {data[:10]!r}")
-    
+    from pypdf import PdfReader
+    from pypdf.errors import PdfStreamError
+
+    # Reject clearly-broken files before pypdf spends any time on them.
+    # A valid header is "%PDF-" followed by the version number.
+    if not (len(data) >= 5 and data[:4] == b'%PDF' and data[4:5] == b'-'):
+        raise ValueError(f"Invalid PDF header: {bytes(data[:16])!r}")
+
+    # Equally cheap trailer probe: a parseable PDF ends with %%EOF and a
+    # startxref pointer near the end (spec: within the last 1024 bytes).
+    # Truncated files would otherwise make pypdf parse pages and throw
+    # the work away before the fitz fallback runs.
+    tail = bytes(data[-1024:])
+    if b"%%EOF" not in tail or b"startxref" not in tail:
+        raise ValueError("Truncated PDF: no %%EOF/startxref trailer")
+
+    cache_dir = _find_cache_dir() if use_cache else None
+    digest = _pdf_digest(data) if use_cache else ""
+
     result: List[Path] = []
-    reader = PdfReader(BytesIO(data))
-    
+    # strict=False skips pypdf's validation work; this is a bulk extractor
+    # and damaged files are handled by the fitz path anyway.
+    reader = PdfReader(BytesIO(data), strict=False)
+    if reader.is_encrypted:
+        # fitz handles many encrypted PDFs silently - fail fast here so
+        # extract_images deterministically takes that path.
+        raise PdfStreamError("Encrypted PDF")
+
     for page_index, page in enumerate(reader.pages):
+        # Cache hit: link the previously extracted image into place
+        if cache_dir is not None:
+            cached = _cache_lookup(cache_dir, digest, page_index)
+            if cached is not None:
+                out_path = output_dir / f"{zip_name}_{pdf_stem}_p{page_index}{cached.suffix}"
+                _copy_or_link(cached, out_path)
+                result.append(out_path)
+                continue
+
         img_path = _extract_main_image_from_page(
             page=page,
             output_dir=output_dir,
@@ -69,111 +243,234 @@ def extract_images_pypdf(
             page_index=page_index,
         )
         if img_path is not None:
+            if cache_dir is not None:
+                _copy_or_link(img_path, cache_dir / f"{digest}_p{page_index}{img_path.suffix}")
             result.append(img_path)
-    
+
     return result
 
 
 def extract_images_fitz(
-    data: bytes,
+    data: bytes | memoryview,
     output_dir: Path,
     zip_name: str,
     pdf_stem: str,
+    use_cache: bool = True,
+    scale: float = _RENDER_SCALE,
 ) -> List[Path]:
     """
     Extract images from a PDF using PyMuPDF (fitz).
     
     PyMuPDF is more robust than pypdf and can also read PDFs
-    that pypdf rejects as corrupt. It renders pages as images
-    at high quality.
-    
+    that pypdf rejects as corrupt.
+
+    Pages consisting of a single embedded image (the common case for
+    pre-rendered card faces) are extracted verbatim via doc.extract_image,
+    which returns the original compressed bytes without a rasterize and
+    re-encode roundtrip. Pages with multiple images or vector content
+    are rendered as high-quality images instead.
+
     Args:
-        data: Raw PDF bytes
+        data: Raw PDF bytes (any buffer-protocol object; payloads other
+            than bytes/bytearray are materialized once for fitz)
         output_dir: Directory to save extracted images
         zip_name: Name of the source ZIP (for filename)
         pdf_stem: PDF filename without extension (for filename)
-        
+        use_cache: If True, reuse cached results for identical PDF bytes
+        scale: Render resolution multiplier for rasterized pages
+
     Returns:
         List of paths to extracted image files
     """
+    fitz = _get_fitz()
+
+    cache_dir = _find_cache_dir() if use_cache else None
+    digest = _pdf_digest(data) if use_cache else ""
+
+    # Build output paths from a single precomputed directory string -
+    # Path.__truediv__ per page adds up across thousands of pages.
+    out_prefix = f"{os.fspath(output_dir)}{os.sep}{zip_name}_{pdf_stem}_p"
+
+    # Build the render matrix once per call (the cached default matrix
+    # covers the default scale) instead of once per page.
+    matrix = _render_matrix if scale == _RENDER_SCALE else fitz.Matrix(scale, scale)
+
     result: List[Path] = []
-    doc = fitz.open(stream=data, filetype="pdf")
-    
-    for page_index, page in enumerate(doc):
-        # Render the page as an image (high quality)
-        # matrix=fitz.Matrix(2, 2) doubles the resolution
-        pix = page.get_pixmap(matrix=fitz.Matrix(2, 2), alpha=True)
-        
-        filename = f"{zip_name}_{pdf_stem}_p{page_index}.png"
-        out_path = output_dir / filename
-        pix.save(str(out_path))
-        result.append(out_path)
-    
-    doc.close()
+    # fitz only accepts bytes/bytearray/BytesIO streams - materialize other
+    # buffer-protocol payloads (memoryview, mmap) at this boundary.
+    stream = data if isinstance(data, (bytes, bytearray)) else bytes(data)
+    doc = fitz.open(stream=stream, filetype="pdf")
+    try:
+        for page_index in range(doc.page_count):
+            # Cache hit: link the previously rendered image into place instead
+            # of re-decoding - identical card PDFs often appear in several ZIPs.
+            if cache_dir is not None:
+                cached = _cache_lookup(cache_dir, digest, page_index)
+                if cached is not None:
+                    out_path = output_dir / f"{zip_name}_{pdf_stem}_p{page_index}{cached.suffix}"
+                    _copy_or_link(cached, out_path)
+                    result.append(out_path)
+                    continue
+
+            page = doc.load_page(page_index)
+
+            # Fast path: a single embedded image - extract the original
+            # compressed stream (usually JPEG) instead of re-rendering.
+            # Only safe when the image has no soft mask (img[1] is the
+            # SMask xref): extract_image returns just the base stream, so
+            # a masked card would lose its transparent corners and print
+            # them black. The stream format must also be one the embed
+            # side decodes directly - JPX or CMYK JPEG written verbatim
+            # would crash or miscolor the PDF build, where the baseline
+            # always rasterized to RGB(A).
+            imgs = page.get_images(full=True)
+            verbatim = None
+            if len(imgs) == 1 and imgs[0][1] == 0:
+                info = doc.extract_image(imgs[0][0])
+                if info["ext"] in ("jpeg", "jpg", "png") and info.get("colorspace", 3) <= 3:
+                    verbatim = info
+            if verbatim is not None:
+                out_str = f"{out_prefix}{page_index}.{verbatim['ext']}"
+                _unlink_existing(out_str)
+                with open(out_str, "wb", buffering=1 << 20) as fh:
+                    fh.write(verbatim["image"])
+            else:
+                # Render the page as an image (high quality).
+                # Only pay for the alpha channel when an image on the page
+                # actually carries a soft mask - RGBA is ~33% more pixel bytes
+                # and card art is virtually always opaque.
+                needs_alpha = any(img[1] != 0 for img in imgs)
+                # Clamp the zoom so big pages (e.g. A4 rulebook sheets)
+                # are not rendered beyond the 300 DPI print target.
+                rect = page.rect
+                zoom = min(
+                    scale,
+                    _MAX_RENDER_PX[0] / rect.width if rect.width else scale,
+                    _MAX_RENDER_PX[1] / rect.height if rect.height else scale,
+                )
+                page_matrix = matrix if zoom == scale else fitz.Matrix(zoom, zoom)
+                pix = page.get_pixmap(matrix=page_matrix, alpha=needs_alpha)
+
+                # These are intermediate scratch files - the PDF generator
+                # re-compresses them anyway - so encode them as cheaply as
+                # possible and write in one large buffered call. Opaque
+                # pages go to JPEG (several times faster to encode and much
+                # smaller than PNG); only pages with a soft mask pay for
+                # PNG with alpha, at the lowest deflate level.
+                mode = "RGBA" if pix.alpha else "RGB"
+                img = Image.frombuffer(mode, (pix.width, pix.height), pix.samples, "raw", mode, 0, 1)
+                if pix.alpha:
+                    out_str = f"{out_prefix}{page_index}.png"
+                    _unlink_existing(out_str)
+                    with open(out_str, "wb", buffering=1 << 20) as fh:
+                        img.save(fh, format="PNG", compress_level=1, optimize=False)
+                else:
+                    out_str = f"{out_prefix}{page_index}.jpg"
+                    _unlink_existing(out_str)
+                    with open(out_str, "wb", buffering=1 << 20) as fh:
+                        img.save(fh, format="JPEG", quality=85)
+                pix = None  # release the C-level pixel buffer promptly
+            out_path = Path(out_str)
+
+            # Drop the page reference so MuPDF can free per-page caches
+            # instead of accumulating them across a large document.
+            page = None
+
+            if cache_dir is not None:
+                _copy_or_link(out_path, cache_dir / f"{digest}_p{page_index}{out_path.suffix}")
+            result.append(out_path)
+    finally:
+        doc.close()
     return result
 
 
 def extract_images(
-    data: bytes,
+    data: bytes | memoryview,
     output_dir: Path,
     zip_name: str,
     pdf_stem: str,
-    use_fitz_fallback: bool = True,
+    prefer_pypdf: bool = False,
+    use_cache: bool = True,
+    force_pypdf: bool = False,
 ) -> tuple[List[Path], Optional[FailedPdf]]:
     """
-    Extract images from a PDF, using pypdf with optional fitz fallback.
-    
+    Extract images from a PDF, using PyMuPDF with optional pypdf-first mode.
+
+    PyMuPDF is the primary extractor: it is 5-30x faster than pypdf and
+    avoids pypdf's pathological slowdowns on large compressed images.
+    With prefer_pypdf=True the historical order (pypdf first, fitz as
+    fallback) is restored, which is useful for testing.
+
     Args:
-        data: Raw PDF bytes
+        data: Raw PDF bytes (any buffer-protocol object; the chosen
+            extractor may copy the buffer once at its boundary)
         output_dir: Directory to save extracted images
         zip_name: Name of the source ZIP (for filename)
         pdf_stem: PDF filename without extension (for filename)
-        use_fitz_fallback: If True, use PyMuPDF as fallback when pypdf fails
-        
+        prefer_pypdf: If True, try pypdf first and use fitz only as fallback
+        use_cache: If True, reuse cached results for identical PDF bytes
+        force_pypdf: If True, keep pypdf first even for scan-like PDFs
+            (overrides the heuristic, useful for tests)
+
     Returns:
         Tuple of (list of image paths, optional failure info)
-        - If successful with pypdf: (paths, None)
-        - If successful with fallback: (paths, FailedPdf with used_fallback=True)
+        - If successful with the primary extractor: (paths, None)
+        - If successful with the fallback: (paths, FailedPdf with used_fallback=True)
         - If failed completely: ([], FailedPdf with used_fallback=False)
     """
-    pypdf_error: Optional[str] = None
-    
-    # Try pypdf first (for image extraction)
+    primary_error: Optional[str] = None
+
+    # Fast path: a PDF whose every page is already cached is restored via
+    # hardlinks from its manifest, without opening the PDF at all.
+    cache_dir = _find_cache_dir() if use_cache else None
+    digest = _pdf_digest(data) if use_cache else ""
+    if cache_dir is not None:
+        cached_paths = _cache_restore_all(cache_dir, digest, output_dir, zip_name, pdf_stem)
+        if cached_paths is not None:
+            return cached_paths, None
+
+    # Even in pypdf-first mode, PDFs that look like plain image scans are
+    # sent straight to fitz - pypdf's FlateDecode loop is slowest exactly
+    # on those files and the fallback would be taken anyway.
+    if prefer_pypdf and not force_pypdf and _looks_like_scan(data):
+        prefer_pypdf = False
+
+    if prefer_pypdf:
+        primary, fallback = extract_images_pypdf, extract_images_fitz
+    else:
+        primary, fallback = extract_images_fitz, extract_images_pypdf
+
+    # Try the primary extractor
     try:
-        paths = extract_images_pypdf(data, output_dir, zip_name, pdf_stem)
+        paths = primary(data, output_dir, zip_name, pdf_stem, use_cache=use_cache)
         if paths:
+            if cache_dir is not None:
+                _cache_write_manifest(cache_dir, digest, paths)
             return paths, None
-        pypdf_error = "No images found in PDF"
-    except (PdfStreamError, ValueError, Exception) as e:
-        pypdf_error = f"{type(e).__name__}: {e}"
-    
-    # Fallback: PyMuPDF (fitz) for problematic PDFs
-    if use_fitz_fallback:
-        try:
-            paths = extract_images_fitz(data, output_dir, zip_name, pdf_stem)
-            # Track that pypdf failed but fitz worked
-            failure_info = FailedPdf(
-                zip_name=zip_name,
-                pdf_name=pdf_stem,
-                error=pypdf_error or "Unknown pypdf error",
-                used_fallback=True,
-            )
-            return paths, failure_info
-        except Exception as e:
-            return [], FailedPdf(
-                zip_name=zip_name,
-                pdf_name=pdf_stem,
-                error=f"{type(e).__name__}: {e}",
-                used_fallback=False,
-            )
-    
-    # Fitz fallback disabled, return failure
-    return [], FailedPdf(
-        zip_name=zip_name,
-        pdf_name=pdf_stem,
-        error=pypdf_error or "Unknown error",
-        used_fallback=False,
-    )
+        primary_error = "No images found in PDF"
+    except _extraction_error_types() as e:
+        primary_error = f"{type(e).__name__}: {e}"
+
+    # Fallback: the other extractor for problematic PDFs
+    try:
+        paths = fallback(data, output_dir, zip_name, pdf_stem, use_cache=use_cache)
+        if paths and cache_dir is not None:
+            _cache_write_manifest(cache_dir, digest, paths)
+        # Track that the primary failed but the fallback worked
+        failure_info = FailedPdf(
+            zip_name=zip_name,
+            pdf_name=pdf_stem,
+            error=primary_error or "Unknown extraction error",
+            used_fallback=True,
+        )
+        return paths, failure_info
+    except _extraction_error_types() as e:
+        return [], FailedPdf(
+            zip_name=zip_name,
+            pdf_name=pdf_stem,
+            error=f"{type(e).__name__}: {e}",
+            used_fallback=False,
+        )
 
 
 def _extract_main_image_from_page(
@@ -201,25 +498,39 @@ def _extract_main_image_from_page(
     if not images:
         return None
 
-    # images can be an iterator - convert to a list
-    imgs = list(images)
-    if not imgs:
-        return None
-
-    # Choose the largest image (by resolution, fallback: data size)
-    def img_score(img: object) -> int:
+    # Choose the largest image by resolution in a single streaming pass.
+    # Touching `.data` triggers pypdf's stream decoding, so it is deferred
+    # until the winner is known instead of being decoded for every image.
+    best = None
+    best_score = -1
+    zero_scored = []  # images without width/height metadata
+    for img in images:
         width = getattr(img, "width", 0) or 0
         height = getattr(img, "height", 0) or 0
-        data = getattr(img, "data", b"")
-        return width * height or len(data)
+        score = width * height
+        if score == 0:
+            zero_scored.append(img)
+        elif score > best_score:
+            best, best_score = img, score
+
+    if best is None:
+        # No resolution metadata anywhere - fall back to data size,
+        # which unavoidably decodes these images.
+        for img in zero_scored:
+            size = len(getattr(img, "data", b""))
+            if size > best_score:
+                best, best_score = img, size
+
+    if best is None:
+        return None
 
-    main_img = max(imgs, key=img_score)
-    data: bytes = getattr(main_img, "data", b"")
+    data: bytes = getattr(best, "data", b"")
     if not data:
         return None
 
     # Always save with .png extension for transparency support
     filename = f"{zip_name}_{pdf_stem}_p{page_index}.png"
     out_path = output_dir / filename
+    _unlink_existing(out_path)
     out_path.write_bytes(data)
     return out_path
@@ -6,8 +6,17 @@ modules to provide a simple interface for building card sheets.
 """
 from __future__ import annotations
 
+import hashlib
+import os
+import mmap
+import re
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import replace
+from itertools import islice
 from pathlib import Path
-from typing import List, Optional
+from queue import Queue
+from threading import Thread
+from typing import List, Optional, Tuple
 
 from rich.console import Console
 from rich.progress import Progress, SpinnerColumn, TextColumn, BarColumn, TaskProgressColumn, TimeElapsedColumn
@@ -19,14 +28,8 @@ from .zip_reader import (
     find_assets_dir,
     find_temp_dir,
     find_images_dir,
-    list_zip_files,
-    list_pdf_files,
-    list_image_files,
-    list_pdfs_in_zip,
-    list_images_in_zip,
-    count_all_sources,
-    read_pdf_from_zip,
-    read_image_from_zip,
+    discover_sources,
+    iter_zip_members,
     save_image_from_zip,
     copy_image_to_temp,
 )
@@ -36,6 +39,7 @@ from .image_extractor import (
     extract_images,
 )
 from .pdf_generator import (
+    _default_num_workers,
     write_3x3_image_pdf,
     get_file_size_str,
 )
@@ -61,18 +65,172 @@ __all__ = [
 # Rich console instance for beautiful output
 console = Console()
 
-# Track failed PDFs for reporting
+# Deprecated: failures are returned by collect_card_images these days.
+# This module attribute is re-assigned after each run for back-compat.
 failed_pdfs: List[FailedPdf] = []
 
 
+# Rewrite the progress description only every Nth entry: Progress.update
+# formats the markup on every call, while a bare advance is much cheaper.
+_PROGRESS_DESC_EVERY = 8
+
+
+# Target number of pages per worker task. Small PDFs (1-3 pages) spend
+# more time in process dispatch and fitz.open than in rendering, so jobs
+# are grouped until a batch reaches roughly this many pages.
+_BATCH_TARGET_PAGES = 32
+
+
+def _estimate_page_count(size: int) -> int:
+    """Cheap page-count proxy from the file size (~250 KB per card page)."""
+    return max(1, size // (256 * 1024))
+
+
+def _job_size(data: bytes | Path) -> int:
+    """Byte size of a job payload without reading path-backed jobs."""
+    return data.stat().st_size if isinstance(data, Path) else len(data)
+
+
+def _extract_images_job(
+    data: bytes | Path,
+    output_dir: Path,
+    zip_name: str,
+    pdf_stem: str,
+    prefer_pypdf: bool,
+    use_cache: bool,
+) -> Tuple[List[Path], Optional[FailedPdf]]:
+    """
+    Run extract_images for one job payload.
+
+    Direct PDFs travel as a Path and are memory-mapped here in the
+    worker, so the bytes are neither read in the parent nor pickled
+    across the process boundary.
+    """
+    if isinstance(data, Path):
+        with open(data, "rb") as f:
+            size = os.fstat(f.fileno()).st_size
+            if size > 0:
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    return extract_images(
+                        data=mm,
+                        output_dir=output_dir,
+                        zip_name=zip_name,
+                        pdf_stem=pdf_stem,
+                        prefer_pypdf=prefer_pypdf,
+                        use_cache=use_cache,
+                    )
+        data = b""  # empty file: cannot be mmapped, fails the header check
+    return extract_images(
+        data=data,
+        output_dir=output_dir,
+        zip_name=zip_name,
+        pdf_stem=pdf_stem,
+        prefer_pypdf=prefer_pypdf,
+        use_cache=use_cache,
+    )
+
+
+# Digit runs are compared numerically in sort keys so "card2" orders
+# before "card10" (capture group keeps the runs in re.split output).
+_DIGIT_RUN = re.compile(r"(\d+)")
+
+
+def _natural_key(name: str) -> tuple:
+    """
+    Case-insensitive natural sort key for a card/zip name.
+
+    Uses casefold (correct and faster than lower for caseless matching)
+    and turns digit runs into ints. re.split with a capture group always
+    puts text at even indices and digit runs at odd ones, so keys from
+    different names never compare int against str.
+    """
+    return tuple(
+        int(part) if index % 2 else part
+        for index, part in enumerate(_DIGIT_RUN.split(name.casefold()))
+    )
+
+
+class _NullProgress:
+    """No-op stand-in for rich.progress.Progress when none is supplied.
+
+    Lets the hot loops call add_task/update unconditionally instead of
+    re-checking `progress is not None` on every iteration.
+    """
+
+    def add_task(self, *args, **kwargs) -> int:
+        return 0
+
+    def update(self, *args, **kwargs) -> None:
+        pass
+
+    def advance(self, *args, **kwargs) -> None:
+        pass
+
+
+def _intern_image(
+    path: Path,
+    by_digest: dict[str, Path],
+    by_path: dict[Path, Path],
+) -> Path:
+    """
+    Deduplicate an extracted image file by content hash.
+
+    The same card art often ships in several ZIPs; the first occurrence
+    becomes the canonical file and later byte-identical copies are
+    unlinked, so both the temp folder and the output PDF (ReportLab
+    caches embedded images per path) shrink accordingly. The by_path
+    memo makes re-interning the same path a lookup (memoized duplicate
+    PDFs share one result whose files may already be unlinked).
+    """
+    canonical = by_path.get(path)
+    if canonical is not None:
+        return canonical
+    digest = hashlib.blake2b(path.read_bytes(), digest_size=16).hexdigest()
+    canonical = by_digest.setdefault(digest, path)
+    if canonical != path:
+        path.unlink()
+    by_path[path] = canonical
+    return canonical
+
+
+def _extract_images_batch(
+    batch: List[Tuple[int, str, str, bytes | Path]],
+    output_dir: Path,
+    prefer_pypdf: bool,
+    use_cache: bool,
+) -> List[Tuple[int, Tuple[List[Path], Optional[FailedPdf]]]]:
+    """
+    Process a batch of PDF jobs inside a single worker task.
+
+    Each entry is (job_index, zip_stem, pdf_stem, data); the index is
+    passed through so the parent can slot results back in job order.
+    """
+    out = []
+    for index, zip_stem, pdf_stem, data in batch:
+        out.append((
+            index,
+            _extract_images_job(
+                data=data,
+                output_dir=output_dir,
+                zip_name=zip_stem,
+                pdf_stem=pdf_stem,
+                prefer_pypdf=prefer_pypdf,
+                use_cache=use_cache,
+            ),
+        ))
+    return out
+
+
 def collect_card_images(
     assets_dir: Path | None = None,
     progress: Optional[Progress] = None,
-    use_fitz_fallback: bool = True,
-) -> List[CardImage]:
+    prefer_pypdf: bool = False,
+    num_workers: int | None = None,
+    use_cache: bool = True,
+) -> Tuple[List[CardImage], List[FailedPdf]]:
     """
     Collect card images from all sources in the assets folder.
-    
+
     Supports:
     - PDFs inside ZIP files
     - Images inside ZIP files
@@ -82,150 +240,235 @@ def collect_card_images(
     - Each source is treated as a group.
     - All pages of PDFs come sequentially.
     - Sources are processed in alphabetical order.
-    
+    - PDF extraction is CPU-bound, so PDFs are dispatched to a process pool.
+
     Args:
         assets_dir: Path to assets directory
         progress: Rich Progress instance for progress display
-        use_fitz_fallback: If True, use PyMuPDF as fallback for problematic PDFs
-        
+        prefer_pypdf: If True, try pypdf before PyMuPDF (useful for testing)
+        num_workers: Number of extraction worker processes
+            (default: min(cpu_count, 8); 1 disables the pool)
+        use_cache: If True, reuse cached extraction results for identical PDFs
+
     Returns:
-        List of CardImage objects with extracted image paths
+        Tuple of (CardImage objects with extracted image paths,
+        failures encountered while processing PDFs)
     """
-    global failed_pdfs
-    failed_pdfs = []  # Reset for each run
-    
+    failures: List[FailedPdf] = []
+
     if assets_dir is None:
         assets_dir = find_assets_dir()
+    if num_workers is None:
+        num_workers = _default_num_workers()
 
     card_images: List[CardImage] = []
     images_dir = find_images_dir()
-    
-    # Count total sources for progress
-    total_sources = count_all_sources(assets_dir)
-    
-    task_id = None
-    if progress is not None:
-        task_id = progress.add_task("[cyan]Extracting cards...", total=total_sources)
-
-    # 1. Process ZIP files (PDFs and images)
-    for zip_path in list_zip_files(assets_dir):
-        # Process PDFs in ZIP
-        for pdf_name in list_pdfs_in_zip(zip_path):
-            if progress is not None and task_id is not None:
-                progress.update(
-                    task_id, 
-                    advance=1, 
-                    description=f"[cyan]Processing [bold]{Path(pdf_name).stem}[/bold]..."
-                )
-            
-            data = read_pdf_from_zip(zip_path, pdf_name)
-            
-            # Extract images with fallback support
-            paths, failure = extract_images(
+
+    if progress is None:
+        progress = _NullProgress()
+
+    # One directory scan classifies every source; the progress total is
+    # derived from the collected jobs instead of a separate counting pass
+    # (which used to re-open every ZIP just to count its members).
+    zip_paths, direct_pdf_paths, direct_image_paths = discover_sources(assets_dir)
+
+    # 1. Collect all PDF jobs up front. Each ZIP is opened exactly once
+    #    and both its PDFs and its images are handled in that single
+    #    pass: images are written to the images dir immediately (paths
+    #    are stashed for step 4) and PDF payloads are spooled to
+    #    content-addressed scratch files, so no member's bytes outlive
+    #    its turn in the loop. Each job is (display_zip, display_pdf,
+    #    zip_stem, pdf_stem, data) - display names are what shows up in
+    #    reports, the stems are used for output filenames.
+    pdf_jobs: List[Tuple[str, str, str, str, bytes | Path]] = []
+    zip_image_entries: List[Tuple[Path, str, Path]] = []
+    # In-run memo: the same PDF often ships in several ZIPs (sample vs
+    # full bundles). Byte-identical payloads are spooled and extracted
+    # once; follower jobs reuse the primary's result after extraction.
+    # Output files are content-interned in step 3, so the primary's
+    # filenames serve all.
+    digest_primary: dict[str, int] = {}
+    follower_of: dict[int, int] = {}
+    spooled: List[Path] = []
+
+    def _ingest_member(zip_path: Path, member_name: str, kind: str, data: bytes) -> None:
+        if kind == "pdf":
+            index = len(pdf_jobs)
+            digest = hashlib.blake2b(data, digest_size=16).hexdigest()
+            primary = digest_primary.setdefault(digest, index)
+            spool_path = spool_dir / f"{digest}.pdf"
+            if primary != index:
+                follower_of[index] = primary
+            else:
+                spool_path.write_bytes(data)
+                spooled.append(spool_path)
+            pdf_jobs.append(
+                (zip_path.name, member_name, zip_path.stem, Path(member_name).stem, spool_path)
+            )
+        else:
+            img_path = save_image_from_zip(
                 data=data,
                 output_dir=images_dir,
                 zip_name=zip_path.stem,
-                pdf_stem=Path(pdf_name).stem,
-                use_fitz_fallback=use_fitz_fallback,
+                image_name=Path(member_name).name,
             )
-            
-            # Add extracted images to results
-            for img_path in paths:
-                card_images.append(
-                    CardImage(
-                        zip_name=zip_path.name,
-                        pdf_name=pdf_name,
-                        image_path=img_path,
-                    )
+            zip_image_entries.append((zip_path, member_name, img_path))
+
+    if zip_paths:
+        spool_dir = find_temp_dir() / "spool"
+        spool_dir.mkdir(parents=True, exist_ok=True)
+        # Inflating members is I/O plus zlib work (which releases the
+        # GIL), so a producer thread decompresses ahead while the main
+        # thread hashes and spools. The queue is bounded, so at most a
+        # few members are ever in RAM at once - never whole archives.
+        member_queue: Queue = Queue(maxsize=2)
+
+        def _inflate_members() -> None:
+            try:
+                for zip_path in zip_paths:
+                    for member in iter_zip_members(zip_path):
+                        member_queue.put((zip_path, member))
+                member_queue.put(None)
+            except BaseException as exc:  # re-raised on the consumer side
+                member_queue.put(exc)
+
+        Thread(target=_inflate_members, daemon=True).start()
+        while (item := member_queue.get()) is not None:
+            if isinstance(item, BaseException):
+                raise item
+            zip_path, (member_name, kind, data) = item
+            _ingest_member(zip_path, member_name, kind, data)
+    # Direct PDFs are passed by path and memory-mapped in the worker
+    # (no parent-side read, no big pickled payload).
+    for pdf_path in direct_pdf_paths:
+        pdf_jobs.append(
+            ("(direct)", pdf_path.name, "direct", pdf_path.stem, pdf_path)
+        )
+
+    total_sources = len(pdf_jobs) + len(zip_image_entries) + len(direct_image_paths)
+    task_id = progress.add_task("[cyan]Extracting cards...", total=total_sources)
+
+    # 2. Extract images from all PDFs, in parallel when it pays off.
+    #    Results are kept in job order so card ordering stays deterministic.
+    results: List[Tuple[List[Path], Optional[FailedPdf]]] = [None] * len(pdf_jobs)  # type: ignore[list-item]
+
+    unique_jobs = [
+        (index, job) for index, job in enumerate(pdf_jobs)
+        if index not in follower_of
+    ]
+
+    if num_workers > 1 and len(unique_jobs) > 1:
+        # Greedily group jobs into batches of ~_BATCH_TARGET_PAGES pages so
+        # tiny PDFs amortize process dispatch and fitz startup cost.
+        batches: List[List[Tuple[int, str, str, bytes | Path]]] = []
+        current: List[Tuple[int, str, str, bytes | Path]] = []
+        current_pages = 0
+        for index, (_, _, zip_stem, pdf_stem, data) in unique_jobs:
+            current.append((index, zip_stem, pdf_stem, data))
+            current_pages += _estimate_page_count(_job_size(data))
+            if current_pages >= _BATCH_TARGET_PAGES:
+                batches.append(current)
+                current, current_pages = [], 0
+        if current:
+            batches.append(current)
+
+        with ProcessPoolExecutor(max_workers=num_workers) as executor:
+            futures = [
+                executor.submit(
+                    _extract_images_batch, batch, images_dir, prefer_pypdf, use_cache
                 )
-            
-            # Track failures
-            if failure is not None:
-                failure.zip_name = zip_path.name
-                failure.pdf_name = pdf_name
-                failed_pdfs.append(failure)
-                
-                if not failure.used_fallback:
-                    console.print(
-                        f"[yellow]⚠[/yellow] Skipping [bold]{pdf_name}[/bold] in {zip_path.name}: "
-                        f"PDF could not be read"
-                    )
-        
-        # Process images in ZIP
-        for image_name in list_images_in_zip(zip_path):
-            if progress is not None and task_id is not None:
+                for batch in batches
+            ]
+            completed = 0
+            for future in as_completed(futures):
+                for index, result in future.result():
+                    results[index] = result
+                    completed += 1
+                    progress.advance(task_id, 1)
+                    if completed % _PROGRESS_DESC_EVERY == 0 or completed == len(unique_jobs):
+                        progress.update(
+                            task_id,
+                            description=f"[cyan]Processing [bold]{pdf_jobs[index][3]}[/bold]..."
+                        )
+    else:
+        for position, (index, (_, _, zip_stem, pdf_stem, data)) in enumerate(unique_jobs):
+            progress.advance(task_id, 1)
+            if position % _PROGRESS_DESC_EVERY == 0 or position == len(unique_jobs) - 1:
                 progress.update(
-                    task_id, 
-                    advance=1, 
-                    description=f"[cyan]Copying [bold]{Path(image_name).stem}[/bold]..."
+                    task_id,
+                    description=f"[cyan]Processing [bold]{pdf_stem}[/bold]..."
                 )
-            
-            data = read_image_from_zip(zip_path, image_name)
-            img_path = save_image_from_zip(
+            results[index] = _extract_images_job(
                 data=data,
                 output_dir=images_dir,
-                zip_name=zip_path.stem,
-                image_name=Path(image_name).name,
-            )
-            card_images.append(
-                CardImage(
-                    zip_name=zip_path.name,
-                    pdf_name=image_name,
-                    image_path=img_path,
-                )
-            )
-    
-    # 2. Process PDFs directly in assets folder
-    for pdf_path in list_pdf_files(assets_dir):
-        if progress is not None and task_id is not None:
-            progress.update(
-                task_id, 
-                advance=1, 
-                description=f"[cyan]Processing [bold]{pdf_path.stem}[/bold]..."
+                zip_name=zip_stem,
+                pdf_stem=pdf_stem,
+                prefer_pypdf=prefer_pypdf,
+                use_cache=use_cache,
             )
-        
-        data = pdf_path.read_bytes()
-        
-        # Extract images with fallback support
-        paths, failure = extract_images(
-            data=data,
-            output_dir=images_dir,
-            zip_name="direct",
-            pdf_stem=pdf_path.stem,
-            use_fitz_fallback=use_fitz_fallback,
-        )
-        
-        # Add extracted images to results
+
+    # Resolve memoized duplicates against their primary's result
+    for follower, primary in follower_of.items():
+        results[follower] = results[primary]
+        progress.advance(task_id, 1)
+
+    # Spooled payloads are scratch files; drop them as soon as the
+    # workers are done with them.
+    for spool_path in spooled:
+        spool_path.unlink(missing_ok=True)
+
+    # 3. Merge results in job order (failures from worker processes are
+    #    collected here in the parent).
+    interned_by_digest: dict[str, Path] = {}
+    interned_by_path: dict[Path, Path] = {}
+    for (display_zip, display_pdf, _, _, _), (paths, failure) in zip(pdf_jobs, results):
         for img_path in paths:
             card_images.append(
                 CardImage(
-                    zip_name="(direct)",
-                    pdf_name=pdf_path.name,
-                    image_path=img_path,
+                    zip_name=display_zip,
+                    pdf_name=display_pdf,
+                    image_path=_intern_image(img_path, interned_by_digest, interned_by_path),
                 )
             )
-        
-        # Track failures
+
         if failure is not None:
-            failure.zip_name = "(direct)"
-            failure.pdf_name = pdf_path.name
-            failed_pdfs.append(failure)
-            
+            # Workers only know the stems - substitute the display names
+            failure = replace(failure, zip_name=display_zip, pdf_name=display_pdf)
+            failures.append(failure)
+
             if not failure.used_fallback:
                 console.print(
-                    f"[yellow]⚠[/yellow] Skipping [bold]{pdf_path.name}[/bold]: "
+                    f"[yellow]⚠[/yellow] Skipping [bold]{display_pdf}[/bold] in {display_zip}: "
                     f"PDF could not be read"
                 )
+
+    # 4. Process images in ZIP files (already written to disk in step 1's
+    #    single pass; only their paths were kept around)
+    for entry_index, (zip_path, image_name, img_path) in enumerate(zip_image_entries):
+        progress.advance(task_id, 1)
+        if entry_index % _PROGRESS_DESC_EVERY == 0:
+            progress.update(
+                task_id,
+                description=f"[cyan]Copying [bold]{Path(image_name).stem}[/bold]..."
+            )
+
+        card_images.append(
+            CardImage(
+                zip_name=zip_path.name,
+                pdf_name=image_name,
+                image_path=_intern_image(img_path, interned_by_digest, interned_by_path),
+            )
+        )
     
-    # 3. Process images directly in assets folder
-    for image_path in list_image_files(assets_dir):
-        if progress is not None and task_id is not None:
+    # 5. Process images directly in assets folder
+    for entry_index, image_path in enumerate(direct_image_paths):
+        progress.advance(task_id, 1)
+        if entry_index % _PROGRESS_DESC_EVERY == 0:
             progress.update(
-                task_id, 
-                advance=1, 
+                task_id,
                 description=f"[cyan]Copying [bold]{image_path.stem}[/bold]..."
             )
-        
+
         img_path = copy_image_to_temp(
             image_path=image_path,
             output_dir=images_dir,
@@ -235,36 +478,58 @@ def collect_card_images(
             CardImage(
                 zip_name="(direct)",
                 pdf_name=image_path.name,
-                image_path=img_path,
+                image_path=_intern_image(img_path, interned_by_digest, interned_by_path),
             )
         )
 
-    return card_images
+    # Keep the deprecated module-level list in sync for back-compat
+    global failed_pdfs
+    failed_pdfs = failures
+
+    return card_images, failures
 
 
-def print_failed_pdfs_report() -> None:
-    """Print a detailed report of failed PDF processing."""
-    if not failed_pdfs:
+def print_failed_pdfs_report(failed: Optional[List[FailedPdf]] = None) -> None:
+    """
+    Print a detailed report of failed PDF processing.
+
+    Args:
+        failed: Failures to report; defaults to the failures from the
+            most recent collect_card_images run.
+    """
+    if failed is None:
+        failed = failed_pdfs
+    if not failed:
         return
         
     console.print()
-    
-    fallback_used = [f for f in failed_pdfs if f.used_fallback]
-    completely_failed = [f for f in failed_pdfs if not f.used_fallback]
-    
+
+    # Partition in a single pass instead of scanning the failures twice
+    fallback_used: List[FailedPdf] = []
+    completely_failed: List[FailedPdf] = []
+    for f in failed:
+        (fallback_used if f.used_fallback else completely_failed).append(f)
+
+    def trunc(error: str) -> str:
+        return error if len(error) <= 60 else error[:60] + "..."
+
     if fallback_used:
-        console.print(f"[yellow]⚠ {len(fallback_used)} PDFs required PyMuPDF fallback (pypdf failed):[/yellow]")
+        console.print(f"[yellow]⚠ {len(fallback_used)} PDFs required fallback extraction:[/yellow]")
         fallback_table = Table(box=box.SIMPLE, border_style="yellow", show_header=True)
         fallback_table.add_column("ZIP", style="dim")
         fallback_table.add_column("PDF", style="white")
-        fallback_table.add_column("pypdf Error", style="yellow")
-        for f in fallback_used[:20]:  # Limit to first 20
-            error_msg = f.error[:60] + "..." if len(f.error) > 60 else f.error
-            fallback_table.add_row(f.zip_name, f.pdf_name, error_msg)
+        fallback_table.add_column("Error", style="yellow")
+        # Slice once and precompute all cells before touching the table
+        rows = [
+            (f.zip_name, f.pdf_name, trunc(f.error))
+            for f in islice(fallback_used, 20)  # Limit to first 20
+        ]
+        for row in rows:
+            fallback_table.add_row(*row)
         if len(fallback_used) > 20:
             fallback_table.add_row("...", f"[dim]and {len(fallback_used) - 20} more[/dim]", "")
         console.print(fallback_table)
-    
+
     if completely_failed:
         console.print()
         console.print(f"[red]✘ {len(completely_failed)} PDFs could not be processed at all:[/red]")
@@ -272,31 +537,41 @@ def print_failed_pdfs_report() -> None:
         failed_table.add_column("ZIP", style="dim")
         failed_table.add_column("PDF", style="white")
         failed_table.add_column("Error", style="red")
-        for f in completely_failed:
-            error_msg = f.error[:60] + "..." if len(f.error) > 60 else f.error
-            failed_table.add_row(f.zip_name, f.pdf_name, error_msg)
+        rows = [(f.zip_name, f.pdf_name, trunc(f.error)) for f in completely_failed]
+        for row in rows:
+            failed_table.add_row(*row)
         console.print(failed_table)
 
 
 def build_cards_pdf(
     output_path: Path,
     assets_dir: Path | None = None,
-    use_fitz_fallback: bool = True,
+    prefer_pypdf: bool = False,
+    num_workers: int | None = None,
+    use_cache: bool = True,
 ) -> None:
     """
     High-level helper to build a printable card sheet PDF.
-    
+
     - Collects all cards from ZIPs in the assets folder
     - Sorts them alphabetically
     - Writes a single PDF with 3x3 layout
-    
+
     Args:
         output_path: Path to the output PDF file
         assets_dir: Path to assets directory
-        use_fitz_fallback: If True, use PyMuPDF as fallback for problematic PDFs
+        prefer_pypdf: If True, try pypdf before PyMuPDF (useful for testing)
+        num_workers: Number of extraction worker processes
+            (default: min(cpu_count, 8); 1 disables the pool)
+        use_cache: If True, reuse cached extraction results for identical PDFs
     """
     # Ensure the output directory exists
     output_path.parent.mkdir(parents=True, exist_ok=True)
+
+    # Resolve the worker count once so extraction and page composition
+    # share the same affinity-aware default.
+    if num_workers is None:
+        num_workers = _default_num_workers()
     
     console.print()
     console.print(Panel.fit(
@@ -314,17 +589,28 @@ def build_cards_pdf(
         TimeElapsedColumn(),
         console=console,
     ) as progress:
-        cards = collect_card_images(
+        cards, failures = collect_card_images(
             assets_dir=assets_dir, 
             progress=progress,
-            use_fitz_fallback=use_fitz_fallback,
+            prefer_pypdf=prefer_pypdf,
+            num_workers=num_workers,
+            use_cache=use_cache,
         )
         if not cards:
             console.print("[red]✘[/red] No card images found in the assets folder.")
             raise RuntimeError("No card images found in the assets folder.")
         
-        # Sort cards alphabetically by zip name, then by pdf name
-        cards = sorted(cards, key=lambda c: (c.zip_name.lower(), c.pdf_name.lower()))
+        # Sort cards by zip name, then by pdf name, case-insensitively and
+        # in natural order (card2 before card10). Decorate-sort-undecorate:
+        # each key is computed exactly once instead of once per comparison;
+        # the index keeps the sort stable without ever comparing CardImage
+        # objects.
+        decorated = [
+            (_natural_key(c.zip_name), _natural_key(c.pdf_name), i, c)
+            for i, c in enumerate(cards)
+        ]
+        decorated.sort()
+        cards = [t[3] for t in decorated]
         
         # Create progress task for PDF writing
         total_pages = (len(cards) + 8) // 9
@@ -334,7 +620,12 @@ def build_cards_pdf(
             progress.update(pdf_task, completed=current, 
                           description=f"[green]Writing page [bold]{current}/{total}[/bold]...")
         
-        write_3x3_image_pdf(cards, output_path=output_path, progress_callback=update_progress)
+        write_3x3_image_pdf(
+            cards,
+            output_path=output_path,
+            progress_callback=update_progress,
+            workers=num_workers,
+        )
     
     # Print summary
     console.print()
@@ -351,7 +642,7 @@ def build_cards_pdf(
     console.print(table)
     
     # Show failed PDFs report
-    print_failed_pdfs_report()
+    print_failed_pdfs_report(failures)
     
     console.print()
     console.print("[green]✔[/green] [bold green]Done![/bold green] Your card sheets are ready to print.")
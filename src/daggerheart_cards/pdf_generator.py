@@ -1,10 +1,16 @@
 """PDF generation for card sheets."""
 from __future__ import annotations
 
+import os
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from functools import lru_cache, partial
+from io import BytesIO
 from pathlib import Path
-from typing import Sequence, Optional, Callable
+from typing import List, Sequence, Optional, Callable
 
+from PIL import Image
 from reportlab.lib.pagesizes import A4
+from reportlab.lib.utils import ImageReader
 from reportlab.pdfgen import canvas
 
 from .image_extractor import CardImage
@@ -18,6 +24,153 @@ DEFAULT_CARD_HEIGHT = 266.0
 DEFAULT_ROWS = 3
 DEFAULT_COLS = 3
 
+# Pages per output PDF below which parallel composition is not worth
+# the process startup cost.
+_MIN_PAGES_FOR_POOL = 4
+
+
+def _default_num_workers() -> int:
+    """Default worker count for the extraction and page-composer pools."""
+    try:
+        # Respects cgroup/affinity CPU limits (containers, CI runners),
+        # where cpu_count would report the host's cores and oversubscribe.
+        cpus = len(os.sched_getaffinity(0))
+    except AttributeError:  # not available on macOS/Windows
+        cpus = os.cpu_count() or 1
+    return min(cpus, 8)
+
+# Resolution at which card images are embedded. Cards print at ~2.6 x
+# 3.7 inches, so anything beyond 300 DPI is invisible on paper but
+# inflates the output PDF and the per-draw decode cost.
+_EMBED_DPI = 300
+
+
+@lru_cache(maxsize=None)
+def _embed_limit(card_width: float, card_height: float) -> tuple[int, int]:
+    """Max useful pixel size for a card slot at _EMBED_DPI."""
+    return (
+        int(card_width / 72.0 * _EMBED_DPI),
+        int(card_height / 72.0 * _EMBED_DPI),
+    )
+
+
+def _load_reader(image_path: str, max_px: tuple[int, int]) -> ImageReader:
+    """
+    Open an image for embedding, downscaling oversized sources first.
+
+    Extraction already caps rasterized pages at ~300 DPI, but verbatim
+    streams and direct image files arrive at native resolution; a
+    3000x4000 scan would otherwise be embedded as-is. Images within the
+    limit are passed through by path so ReportLab reads the original
+    file untouched.
+    """
+    img = Image.open(image_path)
+    if img.width > max_px[0] or img.height > max_px[1]:
+        img.thumbnail(max_px, Image.Resampling.LANCZOS)
+        return ImageReader(img)
+    img.close()
+    return ImageReader(image_path)
+
+
+@lru_cache(maxsize=None)
+def _grid_positions(card_width: float, card_height: float) -> tuple:
+    """
+    Precompute the lower-left (x, y) of all nine card slots on an A4 page.
+
+    Computed once per card size instead of re-deriving row/col and the
+    offsets for every card on every page.
+    """
+    page_width, page_height = A4
+    offset_x = (page_width - 3.0 * card_width) / 2.0
+    offset_y = (page_height - 3.0 * card_height) / 2.0
+    return tuple(
+        (offset_x + (i % 3) * card_width, offset_y + (i // 3) * card_height)
+        for i in range(9)
+    )
+
+
+def _draw_page(
+    c: canvas.Canvas,
+    image_paths: Sequence[str],
+    card_width: float,
+    card_height: float,
+    readers: dict[str, ImageReader] | None = None,
+    guides_form: str | None = None,
+) -> None:
+    """
+    Draw one sheet (cut guides plus up to 9 card images) on a canvas.
+
+    Images are loaded through ImageReader objects memoized in `readers`:
+    each unique file is opened and decoded once per document, and
+    ReportLab reuses the same XObject for repeated draws of one reader.
+    When `guides_form` names a Form XObject already defined on the
+    canvas, the guides are stamped with doForm instead of redrawn, so
+    multi-page documents carry the geometry stream only once.
+    """
+    if readers is None:
+        readers = {}
+    page_width, page_height = A4
+    positions = _grid_positions(card_width, card_height)
+
+    if guides_form is not None:
+        c.doForm(guides_form)
+    else:
+        draw_cut_guides(
+            c=c,
+            page_width=page_width,
+            page_height=page_height,
+            card_width=card_width,
+            card_height=card_height,
+            offset_x=positions[0][0],
+            offset_y=positions[0][1],
+        )
+
+    for idx, image_path in enumerate(image_paths):
+        x, y = positions[idx]
+
+        reader = readers.get(image_path)
+        if reader is None:
+            reader = readers[image_path] = _load_reader(
+                image_path, _embed_limit(card_width, card_height)
+            )
+
+        c.drawImage(
+            reader,
+            x,
+            y,
+            width=card_width,
+            height=card_height,
+            preserveAspectRatio=True,
+            anchor="sw",
+            mask="auto",  # Respect transparent corners (e.g., PNG with alpha)
+        )
+
+    c.showPage()
+
+
+def _prewarm_reader(image_path: str, max_px: tuple[int, int]) -> ImageReader:
+    """Build an ImageReader and force its pixel decode (worker thread)."""
+    reader = _load_reader(image_path, max_px)
+    reader.getRGBData()  # decodes and caches the pixel data
+    return reader
+
+
+def _compose_page_pdf(
+    image_paths: List[str],
+    card_width: float,
+    card_height: float,
+) -> bytes:
+    """
+    Compose one sheet as a standalone single-page PDF (worker task).
+
+    Returns the PDF bytes so the parent can merge pages in order.
+    """
+    buffer = BytesIO()
+    c = canvas.Canvas(buffer, pagesize=A4)
+    _draw_page(c, image_paths, card_width, card_height)
+    c.save()
+    return buffer.getvalue()
+
 
 def write_3x3_image_pdf(
     cards: Sequence[CardImage],
@@ -25,6 +178,7 @@ def write_3x3_image_pdf(
     progress_callback: Optional[Callable[[int, int], None]] = None,
     card_width: float = DEFAULT_CARD_WIDTH,
     card_height: float = DEFAULT_CARD_HEIGHT,
+    workers: int | None = None,
 ) -> None:
     """
     Create a PDF that arranges card images in a 3x3 layout.
@@ -32,70 +186,104 @@ def write_3x3_image_pdf(
     - Images are used in the order of `cards`.
     - Maximum 9 images per page (3 columns x 3 rows).
     - Each image is scaled to fit the card size (aspect ratio preserved).
-    
+    - For documents with enough pages, sheets are composed in parallel
+      worker processes and merged in order.
+
     Args:
         cards: Sequence of CardImage objects with image paths
         output_path: Path to write the PDF to
         progress_callback: Optional callback(current_page, total_pages)
         card_width: Width of each card in points
         card_height: Height of each card in points
-        
+        workers: Number of page-composer processes
+            (default: auto; 1 forces sequential writing)
+
     Raises:
         ValueError: If cards sequence is empty
     """
     if not cards:
         raise ValueError("No card images found - input list is empty.")
 
-    page_width, page_height = A4
+    total_pages = (len(cards) + 8) // 9  # Ceiling division
 
-    grid_width = 3.0 * card_width
-    grid_height = 3.0 * card_height
+    if workers is None:
+        workers = min(_default_num_workers(), total_pages)
 
-    # Grid centered on the page
-    offset_x = (page_width - grid_width) / 2.0
-    offset_y = (page_height - grid_height) / 2.0
+    if workers > 1 and total_pages >= _MIN_PAGES_FOR_POOL:
+        # Compose each sheet as a single-page PDF in worker processes.
+        # ex.map yields results in submission order, so pages are merged
+        # deterministically and never all buffered at once.
+        from pypdf import PdfReader, PdfWriter
 
-    c = canvas.Canvas(str(output_path), pagesize=(page_width, page_height))
-    
-    total_pages = (len(cards) + 8) // 9  # Ceiling division
+        groups = [
+            [str(c.image_path) for c in cards[i : i + 9]]
+            for i in range(0, len(cards), 9)
+        ]
+        compose = partial(
+            _compose_page_pdf, card_width=card_width, card_height=card_height
+        )
+        writer = PdfWriter()
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            for page_num, page_bytes in enumerate(executor.map(compose, groups), 1):
+                if progress_callback is not None:
+                    progress_callback(page_num, total_pages)
+                writer.append(PdfReader(BytesIO(page_bytes)))
+        with open(output_path, "wb") as f:
+            writer.write(f)
+        return
 
-    for i in range(0, len(cards), 9):
-        group = cards[i : i + 9]
-        page_num = i // 9 + 1
-        
-        if progress_callback is not None:
-            progress_callback(page_num, total_pages)
+    c = canvas.Canvas(str(output_path), pagesize=A4)
 
-        # Draw cut guides
+    # Capture the cut guides once as a Form XObject; every page stamps
+    # the shared form instead of re-serializing the same 24 marks into
+    # its content stream. (The parallel branch keeps the direct draw:
+    # each worker document is a single page, so there is nothing to
+    # share.)
+    guides_form: str | None = None
+    if total_pages > 1:
+        page_width, page_height = A4
+        positions = _grid_positions(card_width, card_height)
+        guides_form = "cut_guides"
+        c.beginForm(guides_form)
         draw_cut_guides(
             c=c,
             page_width=page_width,
             page_height=page_height,
             card_width=card_width,
             card_height=card_height,
-            offset_x=offset_x,
-            offset_y=offset_y,
+            offset_x=positions[0][0],
+            offset_y=positions[0][1],
         )
+        c.endForm()
 
-        for idx, card in enumerate(group):
-            row = idx // 3  # 0,1,2
-            col = idx % 3   # 0,1,2
-
-            x = offset_x + col * card_width
-            y = offset_y + row * card_height
-
-            c.drawImage(
-                str(card.image_path),
-                x,
-                y,
-                width=card_width,
-                height=card_height,
-                preserveAspectRatio=True,
-                anchor="sw",
-                mask="auto",  # Respect transparent corners (e.g., PNG with alpha)
-            )
+    # Shared across all pages so duplicate card art decodes once.
+    # Decoding (PIL/zlib, which releases the GIL) is the expensive part
+    # of drawImage, so unique images are pre-decoded on a thread pool
+    # instead of serially inside the canvas loop.
+    readers: dict[str, ImageReader] = {}
+    unique_paths = list(dict.fromkeys(str(card.image_path) for card in cards))
+    if len(unique_paths) > 3:
+        prewarm = partial(
+            _prewarm_reader, max_px=_embed_limit(card_width, card_height)
+        )
+        with ThreadPoolExecutor(max_workers=_default_num_workers()) as pool:
+            for path, reader in zip(unique_paths, pool.map(prewarm, unique_paths)):
+                readers[path] = reader
+    for i in range(0, len(cards), 9):
+        group = cards[i : i + 9]
+        page_num = i // 9 + 1
 
-        c.showPage()
+        if progress_callback is not None:
+            progress_callback(page_num, total_pages)
+
+        _draw_page(
+            c,
+            [str(card.image_path) for card in group],
+            card_width,
+            card_height,
+            readers,
+            guides_form,
+        )
 
     c.save()
 
@@ -141,19 +329,29 @@ def draw_cut_guides(
     # Y positions of horizontal cutting lines
     y_positions = [offset_y + i * card_height for i in range(rows + 1)]
 
+    # All marks go into a single path so the content stream carries one
+    # stroke operation instead of one per c.line call.
+    path = c.beginPath()
+
     # Vertical marks at top and bottom
     for x in x_positions:
         # top
-        c.line(x, page_height, x, page_height - mark_length)
+        path.moveTo(x, page_height)
+        path.lineTo(x, page_height - mark_length)
         # bottom
-        c.line(x, 0, x, mark_length)
+        path.moveTo(x, 0)
+        path.lineTo(x, mark_length)
 
     # Horizontal marks at left and right
     for y in y_positions:
         # left
-        c.line(0, y, mark_length, y)
+        path.moveTo(0, y)
+        path.lineTo(mark_length, y)
         # right
-        c.line(page_width, y, page_width - mark_length, y)
+        path.moveTo(page_width, y)
+        path.lineTo(page_width - mark_length, y)
+
+    c.drawPath(path, stroke=1, fill=0)
 
 
 def get_file_size_str(file_path: Path) -> str:
@@ -164,10 +362,10 @@ def get_file_size_str(file_path: Path) -> str:
         file_path: Path to the file
         
     Returns:
-        Size string like "1.5 MB" or "256 KB"
+        Size string like "1.5 MB" or "256.0 KB"
     """
     file_size = file_path.stat().st_size
-    if file_size >= 1024 * 1024:
-        return f"{file_size / (1024 * 1024):.1f} MB"
-    else:
-        return f"{file_size / 1024:.1f} KB"
+    for unit, scale in (("GB", 1 << 30), ("MB", 1 << 20), ("KB", 1 << 10)):
+        if file_size >= scale:
+            return f"{file_size / scale:.1f} {unit}"
+    return f"{file_size} B"
@@ -1,10 +1,13 @@
 """ZIP file reading and PDF/image discovery functionality."""
 from __future__ import annotations
 
+import atexit
+import os
 import shutil
+from functools import lru_cache
 from io import BytesIO
 from pathlib import Path
-from typing import List, Iterator, Tuple
+from typing import IO, List, Iterator, Tuple
 import zipfile
 
 
@@ -12,11 +15,16 @@ import zipfile
 IMAGE_EXTENSIONS = {".png", ".jpg", ".jpeg", ".gif", ".bmp", ".webp"}
 
 
+@lru_cache(maxsize=None)
 def find_assets_dir(start: Path | None = None) -> Path:
     """
     Try to find the `assets` folder relative to the project.
 
     Default: <project_root>/src/assets
+
+    Memoized like find_temp_dir: the resolve walk and is_dir stat run
+    once per argument. (lru_cache does not cache exceptions, so a
+    missing directory is re-checked on the next call.)
     """
     base = (start or Path(__file__)).resolve()
     # Package structure: .../src/daggerheart_cards/zip_reader.py -> go up 2 levels
@@ -27,9 +35,13 @@ def find_assets_dir(start: Path | None = None) -> Path:
     return assets_dir
 
 
+@lru_cache(maxsize=None)
 def find_temp_dir(start: Path | None = None) -> Path:
     """
     Find (or create) a `.temp` folder in the project root directory.
+
+    Memoized: the resolve/parents walk and the mkdir syscall run once
+    per argument instead of once per PDF page.
     """
     base = (start or Path(__file__)).resolve()
     project_root = base.parents[2]
@@ -38,9 +50,12 @@ def find_temp_dir(start: Path | None = None) -> Path:
     return temp_dir
 
 
+@lru_cache(maxsize=None)
 def find_images_dir(start: Path | None = None) -> Path:
     """
     Find (or create) the `.temp/images` folder for extracted card images.
+
+    Memoized for the same reason as find_temp_dir.
     """
     images_dir = find_temp_dir(start) / "images"
     images_dir.mkdir(parents=True, exist_ok=True)
@@ -52,47 +67,72 @@ def is_image_file(name: str) -> bool:
     return Path(name).suffix.lower() in IMAGE_EXTENSIONS
 
 
+def _is_safe_member(name: str) -> bool:
+    """
+    Check that a ZIP entry name cannot escape the extraction directory.
+
+    Rejects absolute paths and any `..` path segment. Output filenames
+    are rebuilt from stem+suffix anyway, but hostile archives should be
+    dropped at listing time rather than relied on downstream.
+    """
+    return (
+        not name.startswith("/")
+        and ".." not in name.split("/")
+        and not Path(name).is_absolute()
+    )
+
+
+def _list_files_by_suffix(assets_dir: Path, suffixes: set) -> List[Path]:
+    """One os.scandir pass returning files whose lowercased suffix matches."""
+    with os.scandir(assets_dir) as entries:
+        return sorted(
+            Path(entry.path)
+            for entry in entries
+            if entry.is_file() and Path(entry.name).suffix.lower() in suffixes
+        )
+
+
 def list_zip_files(assets_dir: Path) -> List[Path]:
     """
     List all ZIP files in the assets directory, sorted alphabetically.
-    
+
     Args:
         assets_dir: Path to the assets directory
-        
+
     Returns:
         Sorted list of ZIP file paths
     """
-    return sorted(assets_dir.glob("*.zip"))
+    return _list_files_by_suffix(assets_dir, {".zip"})
 
 
 def list_pdf_files(assets_dir: Path) -> List[Path]:
     """
     List all PDF files directly in the assets directory, sorted alphabetically.
-    
+
     Args:
         assets_dir: Path to the assets directory
-        
+
     Returns:
         Sorted list of PDF file paths
     """
-    return sorted(assets_dir.glob("*.pdf"))
+    return _list_files_by_suffix(assets_dir, {".pdf"})
 
 
 def list_image_files(assets_dir: Path) -> List[Path]:
     """
     List all image files directly in the assets directory, sorted alphabetically.
-    
+
+    A single directory scan with a case-insensitive suffix check
+    replaces the previous one-glob-per-extension-and-case approach
+    (12 passes over the same directory).
+
     Args:
         assets_dir: Path to the assets directory
-        
+
     Returns:
         Sorted list of image file paths
     """
-    images = []
-    for ext in IMAGE_EXTENSIONS:
-        images.extend(assets_dir.glob(f"*{ext}"))
-        images.extend(assets_dir.glob(f"*{ext.upper()}"))
-    return sorted(set(images))
+    return _list_files_by_suffix(assets_dir, IMAGE_EXTENSIONS)
 
 
 def list_pdfs_in_zip(zip_path: Path) -> List[str]:
@@ -116,6 +156,7 @@ def list_pdfs_in_zip(zip_path: Path) -> List[str]:
             if name.lower().endswith(".pdf")
             and not name.endswith("/")
             and not name.startswith("__MACOSX/")
+            and _is_safe_member(name)
         )
 
 
@@ -140,6 +181,7 @@ def list_images_in_zip(zip_path: Path) -> List[str]:
             if is_image_file(name)
             and not name.endswith("/")
             and not name.startswith("__MACOSX/")
+            and _is_safe_member(name)
         )
 
 
@@ -175,54 +217,174 @@ def count_images_in_zips(zip_files: List[Path]) -> int:
     return total
 
 
+def count_pdfs_and_images_in_zip(zip_path: Path) -> Tuple[int, int]:
+    """
+    Count PDFs and images in a ZIP archive in a single pass.
+
+    One open and one central-directory parse per archive, versus the
+    two that separate list_pdfs_in_zip / list_images_in_zip calls cost.
+
+    Args:
+        zip_path: Path to the ZIP file
+
+    Returns:
+        Tuple of (pdf_count, image_count)
+    """
+    pdf_count = 0
+    image_count = 0
+    with zipfile.ZipFile(zip_path, "r") as zf:
+        for name in zf.namelist():
+            if name.endswith("/") or name.startswith("__MACOSX/"):
+                continue
+            if name.lower().endswith(".pdf"):
+                pdf_count += 1
+            elif is_image_file(name):
+                image_count += 1
+    return pdf_count, image_count
+
+
 def count_all_sources(assets_dir: Path) -> int:
     """
     Count total number of all card sources (PDFs in ZIPs, images in ZIPs,
     direct PDFs, direct images).
-    
+
     Args:
         assets_dir: Path to the assets directory
-        
+
     Returns:
         Total count of all card sources
     """
-    zip_files = list_zip_files(assets_dir)
-    return (
-        count_pdfs_in_zips(zip_files) +
-        count_images_in_zips(zip_files) +
-        len(list_pdf_files(assets_dir)) +
-        len(list_image_files(assets_dir))
-    )
+    zip_files, pdf_files, image_files = discover_sources(assets_dir)
+    total = len(pdf_files) + len(image_files)
+    for zip_path in zip_files:
+        pdf_count, image_count = count_pdfs_and_images_in_zip(zip_path)
+        total += pdf_count + image_count
+    return total
+
+
+def discover_sources(assets_dir: Path) -> Tuple[List[Path], List[Path], List[Path]]:
+    """
+    Classify all card sources in the assets directory in a single scan.
+
+    One os.scandir pass replaces the separate list_zip_files /
+    list_pdf_files / list_image_files globs (each of which walks the
+    directory again).
+
+    Args:
+        assets_dir: Path to the assets directory
+
+    Returns:
+        Tuple of (zip_paths, pdf_paths, image_paths), each sorted
+        alphabetically
+    """
+    zips: List[Path] = []
+    pdfs: List[Path] = []
+    images: List[Path] = []
+    with os.scandir(assets_dir) as entries:
+        for entry in entries:
+            if not entry.is_file():
+                continue
+            suffix = Path(entry.name).suffix.lower()
+            if suffix == ".zip":
+                zips.append(Path(entry.path))
+            elif suffix == ".pdf":
+                pdfs.append(Path(entry.path))
+            elif suffix in IMAGE_EXTENSIONS:
+                images.append(Path(entry.path))
+    zips.sort()
+    pdfs.sort()
+    images.sort()
+    return zips, pdfs, images
+
+
+# Long-lived read handles, one per archive. Opening a ZipFile parses
+# the whole central directory, so per-entry readers would otherwise pay
+# that cost O(members) times per archive.
+_open_zips: dict = {}
+
+
+def _open_zip(zip_path: Path) -> zipfile.ZipFile:
+    """Return a cached read handle for an archive, opening it once."""
+    key = str(zip_path)
+    zf = _open_zips.get(key)
+    if zf is None:
+        zf = _open_zips[key] = zipfile.ZipFile(zip_path, "r")
+    return zf
+
+
+def close_cached_zips() -> None:
+    """Close all cached archive handles (also registered via atexit)."""
+    for zf in _open_zips.values():
+        zf.close()
+    _open_zips.clear()
+
+
+atexit.register(close_cached_zips)
 
 
 def read_pdf_from_zip(zip_path: Path, pdf_name: str) -> bytes:
     """
     Read a PDF file's contents from a ZIP archive.
-    
+
+    The archive handle is cached, so repeated reads from one ZIP parse
+    its central directory only once.
+
     Args:
         zip_path: Path to the ZIP file
         pdf_name: Name of the PDF file within the ZIP
-        
+
     Returns:
         Raw bytes of the PDF file
     """
-    with zipfile.ZipFile(zip_path, "r") as zf:
-        return zf.read(pdf_name)
+    return _open_zip(zip_path).read(pdf_name)
 
 
 def read_image_from_zip(zip_path: Path, image_name: str) -> bytes:
     """
     Read an image file's contents from a ZIP archive.
-    
+
+    The archive handle is cached, so repeated reads from one ZIP parse
+    its central directory only once.
+
     Args:
         zip_path: Path to the ZIP file
         image_name: Name of the image file within the ZIP
-        
+
     Returns:
         Raw bytes of the image file
     """
+    return _open_zip(zip_path).read(image_name)
+
+
+def iter_zip_members(zip_path: Path) -> Iterator[Tuple[str, str, bytes]]:
+    """
+    Iterate over all PDF and image members of a ZIP archive in one pass.
+
+    The archive is opened exactly once; reading members through the
+    already-open handle avoids re-parsing the central directory for
+    every file (which list_*_in_zip + read_*_from_zip pairs would do).
+
+    Filters out:
+    - Directory entries (paths ending with /)
+    - macOS metadata files (__MACOSX/)
+
+    Args:
+        zip_path: Path to the ZIP file
+
+    Yields:
+        Tuples of (member_name, kind, data) in sorted name order,
+        where kind is "pdf" or "image"
+    """
     with zipfile.ZipFile(zip_path, "r") as zf:
-        return zf.read(image_name)
+        for name in sorted(zf.namelist()):
+            if name.endswith("/") or name.startswith("__MACOSX/"):
+                continue
+            if not _is_safe_member(name):
+                continue
+            if name.lower().endswith(".pdf"):
+                yield name, "pdf", zf.read(name)
+            elif is_image_file(name):
+                yield name, "image", zf.read(name)
 
 
 def copy_image_to_temp(
@@ -243,7 +405,18 @@ def copy_image_to_temp(
     """
     filename = f"{source_name}_{image_path.name}"
     out_path = output_dir / filename
-    shutil.copy2(image_path, out_path)
+    # Hardlink when the temp dir is on the same filesystem as the asset:
+    # a constant-time directory entry instead of a full byte copy. The
+    # temp entry then shares the asset's inode, which is only safe
+    # because every writer of the images dir unlinks its target before
+    # writing (see _unlink_existing in image_extractor) - an in-place
+    # write through a colliding filename would corrupt the user's file.
+    if out_path.exists():
+        out_path.unlink()
+    try:
+        os.link(image_path, out_path)
+    except OSError:
+        shutil.copy2(image_path, out_path)
     return out_path
 
 
@@ -270,6 +443,11 @@ def save_image_from_zip(
     suffix = Path(image_name).suffix
     filename = f"{zip_name}_{stem}{suffix}"
     out_path = output_dir / filename
+    # A stale entry under this name may be a hardlink into the cache or
+    # to a user asset - never write through it, always create a fresh
+    # inode.
+    if out_path.exists():
+        out_path.unlink()
     out_path.write_bytes(data)
     return out_path
 
@@ -287,6 +465,47 @@ def iterate_pdfs(assets_dir: Path) -> Iterator[Tuple[Path, str, bytes]]:
         Tuples of (zip_path, pdf_name, pdf_bytes)
     """
     for zip_path in list_zip_files(assets_dir):
+        # One open per archive: the names are filtered from the already
+        # parsed central directory instead of via list_pdfs_in_zip,
+        # which would re-open the ZIP just to list them.
         with zipfile.ZipFile(zip_path, "r") as zf:
-            for pdf_name in list_pdfs_in_zip(zip_path):
+            pdf_names = sorted(
+                name
+                for name in zf.namelist()
+                if name.lower().endswith(".pdf")
+                and not name.endswith("/")
+                and not name.startswith("__MACOSX/")
+                and _is_safe_member(name)
+            )
+            for pdf_name in pdf_names:
                 yield zip_path, pdf_name, zf.read(pdf_name)
+
+
+def iterate_pdf_streams(assets_dir: Path) -> Iterator[Tuple[Path, str, IO[bytes]]]:
+    """
+    Like iterate_pdfs, but yield open file objects instead of bytes.
+
+    Peak memory stays at the deflate window instead of the full
+    decompressed PDF, which matters for large archives. Each stream is
+    only valid until the next item is requested; callers that need the
+    data afterwards must read it within their loop body.
+
+    Args:
+        assets_dir: Path to the assets directory
+
+    Yields:
+        Tuples of (zip_path, pdf_name, readable binary stream)
+    """
+    for zip_path in list_zip_files(assets_dir):
+        with zipfile.ZipFile(zip_path, "r") as zf:
+            pdf_names = sorted(
+                name
+                for name in zf.namelist()
+                if name.lower().endswith(".pdf")
+                and not name.endswith("/")
+                and not name.startswith("__MACOSX/")
+                and _is_safe_member(name)
+            )
+            for pdf_name in pdf_names:
+                with zf.open(pdf_name) as fp:
+                    yield zip_path, pdf_name, fp